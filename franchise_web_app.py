@@ -1,23 +1,74 @@
 import streamlit as st
 import pandas as pd
-import re, math
+import numpy as np
+import pyarrow as pa
+import re, math, os, tempfile
+from html import escape
 from pathlib import Path
 
 # ---------- CONFIG ----------
 DATA_FILE   = "ifpg_dataset.xlsx"              # IFPG master list
 MAP_FILE    = "industry to business type.xlsx" # mapping sheet: business_type | industry
 RESULT_LIMIT = 10
+# columns read from the sheet (plus any "franchise fee…" column)
+USED_COLS   = {"franchise name", "url", "business summary", "industry",
+               "industry_ranking", "cash required", "veteran discount",
+               "number of units open", "support", "semi-absentee ownership",
+               "passive franchise", "b2b", "b2c"}
+FLAG_COLS   = ["semi-absentee ownership", "passive franchise", "b2b", "b2c"]  # Yes/No
+CATEGORY_COLS = ["cash required", "number of units open", "veteran discount"]  # few values
+# liquid-capital answer → max cash required
+CAP_LIMITS  = {"Under $50k": 50_000, "$50k-$99k": 99_000,
+               "$100k-$249k": 249_000, "$250k+": 1_000_000}
+FALLBACK    = "contact us for details"           # shown for blank / missing values
+CARD_TEXT   = {"industry": "industry_fmt", "business summary": "summary_fmt",
+               "veteran discount": "veteran_fmt",
+               "number of units open": "units_fmt", "support": "support_fmt"}
+DISPLAY_COLS = ["link_fmt", "industry_fmt", "summary_fmt",
+                "startup_cost_fmt", "franchise_fee_fmt", "veteran_fmt",
+                "ranking_fmt", "units_fmt", "support_fmt"]   # card field order
 # ----------------------------
 
-# ---------- LOAD MAIN DATA ----------
-try:
-    df = pd.read_excel(DATA_FILE)
-except FileNotFoundError:
-    st.error(f"Could not find the dataset file: {DATA_FILE}")
-    st.stop()
-
-df.columns = df.columns.str.strip().str.lower()
-df.replace(r"_x000D_", " ", regex=True, inplace=True)
+# ---------- PATTERNS (compiled once) ----------
+_NON_NUM   = re.compile(r"[^\d.]")         # strip everything but digits / dot
+_HAS_RANGE = re.compile(r"[-–—]")           # "low - high" style ranges
+_RANGE_SEP = re.compile(r"\s*[-–—]\s*")
+_CASH_LOW  = re.compile(r"(\d[\d,]*)")      # first amount in a "cash required" band
+# IFPG joins industries with "," — a comma followed by a space belongs to the
+# name itself ("Health, Beauty & Nutrition"), so it must not split
+_TAG_SEP   = re.compile(r"\s*,(?!\s)")
+# ----------------------------------------------
+
+# ---------- CELL FORMATTING ----------
+def _format_single(num_str: str) -> str:
+    """'50000' -> '$50,000' ; returns fallback for zero/blank."""
+    n_str = _NON_NUM.sub("", num_str)
+    if n_str == "":
+        return FALLBACK
+    n = float(n_str)
+    if not math.isfinite(n) or n == 0:
+        return FALLBACK
+    return f"${n:,.0f}"
+
+def money(val) -> str:
+    """Format single numbers or ranges; fallback otherwise."""
+    if val is None or pd.isna(val):
+        return FALLBACK
+    txt = str(val).strip()
+    # Detect range separated by -, –, or —
+    if _HAS_RANGE.search(txt):
+        left, right = _RANGE_SEP.split(txt, maxsplit=1)
+        l_fmt, r_fmt = _format_single(left), _format_single(right)
+        if FALLBACK in (l_fmt, r_fmt):
+            return FALLBACK
+        return f"{l_fmt} — {r_fmt}"  # en dash between formatted parts
+    else:
+        return _format_single(txt)
+
+def card_text(x) -> str:
+    """Cell → single-line, HTML-escaped card text; fallback for blanks."""
+    txt = " ".join(str(x).split()) if pd.notna(x) else ""
+    return escape(txt) if txt else FALLBACK
 
 # helper → find the first column that starts with "franchise fee"
 def get_fee_col(cols) -> str | None:
@@ -25,85 +76,245 @@ def get_fee_col(cols) -> str | None:
         if str(c).startswith("franchise fee"):
             return c
     return None
+# ---------------------------------------
 
-fee_col = get_fee_col(df.columns)     # may be None if not present
-# ------------------------------------
-
-# ---------- LOAD BUSINESS‑FOCUS MAP ----------
-if not Path(MAP_FILE).exists():
+# ---------- CHECK INPUT FILES ----------
+# cheap stat() calls first; their mtimes also key the caches below, so an
+# updated sheet is re-read on the next run without restarting the app
+data_path, map_path = Path(DATA_FILE), Path(MAP_FILE)
+if not data_path.exists():
+    st.error(f"Could not find the dataset file: {DATA_FILE}")
+    st.stop()
+if not map_path.exists():
     st.error(f"Mapping file '{MAP_FILE}' not found.")
     st.stop()
+data_mtime, map_mtime = data_path.stat().st_mtime, map_path.stat().st_mtime
+# ---------------------------------------
 
-map_df = pd.read_excel(MAP_FILE)
-map_df.columns = map_df.columns.str.strip().str.lower()
-
-if not {"business_type", "industry"}.issubset(set(map_df.columns)):
-    st.error("Mapping sheet must have columns 'business_type' and 'industry'.")
-    st.stop()
+# ---------- LOAD MAIN DATA ----------
+def read_sheet(path: str) -> pd.DataFrame:
+    """Cleaned IFPG sheet; served from a Parquet copy next to it while that is fresh."""
+    pq = Path(path).with_suffix(".parquet")
+    # the copy is stale once the xlsx or this script (which picks the columns
+    # kept) is newer than it
+    built_after = max(Path(path).stat().st_mtime, Path(__file__).stat().st_mtime)
+    if pq.exists() and pq.stat().st_mtime >= built_after:
+        try:
+            return pd.read_parquet(pq, engine="pyarrow")
+        except (OSError, pa.ArrowInvalid):
+            pass                      # truncated / corrupt copy → rebuild it below
+
+    # parse only the columns the app reads; the rest never leave openpyxl
+    wanted = lambda c: (n := str(c).strip().lower()) in USED_COLS or n.startswith("franchise fee")
+    df = pd.read_excel(path, engine="openpyxl", usecols=wanted)
+    df.columns = df.columns.str.strip().str.lower()
+    # usecols can't stop at the first match, so drop the other fee columns here
+    fee_col = get_fee_col(df.columns)
+    df = df.drop(columns=[c for c in df.columns
+                          if c.startswith("franchise fee") and c != fee_col])
+    # text columns → Arrow-backed strings so .str ops run in Arrow kernels;
+    # the Excel "_x000D_" artefact is stripped with a literal (non-regex) replace
+    text_cols = df.select_dtypes(include=["object", "string"]).columns
+    for c in text_cols:
+        df[c] = df[c].astype("string[pyarrow]").str.replace("_x000D_", " ", regex=False)
+    # write to a temp file of our own and rename, so neither a concurrent
+    # reader nor a second writer ever sees a half-written copy
+    try:
+        fd, tmp = tempfile.mkstemp(dir=pq.parent, prefix=pq.stem + ".",
+                                   suffix=".parquet.tmp")
+        os.close(fd)
+    except OSError:
+        return df                     # read-only checkout → keep using the xlsx
+    try:
+        df.to_parquet(tmp, engine="pyarrow", compression="zstd")
+        os.chmod(tmp, 0o644)          # mkstemp is owner-only; the copy is shared
+        os.replace(tmp, pq)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+    return df
+
+@st.cache_data(show_spinner=False)
+def load_data(path: str, mtime: float) -> pd.DataFrame:
+    """Load the IFPG list once per process; adds the derived filter columns."""
+    df = read_sheet(path)
+    # low-cardinality text → category: int8 codes to copy, and .str / .map
+    # below run once per distinct value instead of once per row
+    for c in CATEGORY_COLS:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    # lower bound of the "cash required" band, parsed once for the filters
+    df["cash_required_low"] = (
+        df["cash required"].str.extract(_CASH_LOW, expand=False)
+                           .str.replace(",", "", regex=False)
+                           .astype("float32")
+    )
+    # ranking → float32 (NaN when missing): half the bytes for the top‑N scan
+    df["industry_ranking"] = pd.to_numeric(df["industry_ranking"],
+                                           errors="coerce").astype("float32")
+    # Yes/No columns → plain bool so the filters are bare masks
+    for c in FLAG_COLS:
+        if c in df.columns:
+            df[c] = df[c].astype(str).str.strip().str.lower().eq("yes").to_numpy(dtype=bool)
+    # money fields formatted once, so the renderer only reads strings
+    fee_col = get_fee_col(df.columns)             # may be None if not present
+    df["startup_cost_fmt"]  = df["cash required"].map(money)
+    df["franchise_fee_fmt"] = df[fee_col].map(money) if fee_col else FALLBACK
+    # card text formatted once (single line, escaped, fallback filled), so
+    # the renderer does no per-cell NA checks; missing columns → FALLBACK
+    for src, dst in CARD_TEXT.items():
+        df[dst] = df[src].astype(object).map(card_text) if src in df.columns else FALLBACK
+    # card heading: brand linked to its IFPG page (plain brand when no url)
+    brand = df["franchise name"].astype(object).map(lambda x: escape(str(x)))
+    if "url" in df.columns:
+        url = df["url"].astype(object)
+        df["link_fmt"] = np.where(
+            url.notna(),
+            '<a href="' + url.map(lambda x: escape(str(x)))
+            + '" target="_blank" rel="noopener noreferrer">' + brand + "</a>",
+            brand,
+        )
+    else:
+        df["link_fmt"] = brand
+    # shortest float32 repr: "12" stays "12", a fractional "12.5" keeps its decimals
+    rank = df["industry_ranking"].to_numpy()
+    df["ranking_fmt"] = np.where(np.isnan(rank), FALLBACK,
+                                 [np.format_float_positional(r, trim="-") for r in rank])
+    return df
+
+df = load_data(DATA_FILE, data_mtime)
+
+# only these columns travel past the filter mask (ranking for the top‑N key)
+display_cols = DISPLAY_COLS + ["industry_ranking"]
+# ------------------------------------
 
-allowed_focus = [
+# ---------- LOAD BUSINESS‑FOCUS MAP ----------
+allowed_focus = frozenset({
     "professional services",
     "retail",
     "green & eco friendly",
     "health",
     "home and family",
-]
-map_df["business_type"] = map_df["business_type"].str.strip().str.lower()
-map_df = map_df[map_df["business_type"].isin(allowed_focus)]
+})
+
+@st.cache_data(show_spinner=False)
+def load_map(path: str, mtime: float) -> tuple[list[str], dict[str, str]]:
+    """Parse the mapping sheet once; sorted focus options + focus → industry regex."""
+    # Arrow-backed columns, like the main sheet, so the .str clean-up below
+    # runs in Arrow kernels
+    map_df = pd.read_excel(path, engine="openpyxl", dtype_backend="pyarrow")
+    map_df.columns = map_df.columns.str.strip().str.lower()
+    if not {"business_type", "industry"}.issubset(set(map_df.columns)):
+        raise ValueError("Mapping sheet must have columns 'business_type' and 'industry'.")
+
+    map_df["business_type"] = map_df["business_type"].str.strip().str.lower()
+    map_df = map_df[map_df["business_type"].isin(allowed_focus)]
+
+    biz_map = map_df.groupby("business_type")["industry"].apply(list).to_dict()
+    # de-duplicated, lower-cased industry set per focus → one pattern each
+    biz_sets = {bf: frozenset(str(x).strip().lower() for x in inds)
+                for bf, inds in biz_map.items()}
+    focus_patterns = {bf: "|".join(re.escape(x) for x in sorted(inds))
+                      for bf, inds in biz_sets.items()}
+    return sorted(biz_map), focus_patterns
 
-biz_map     = map_df.groupby("business_type")["industry"].apply(list).to_dict()
-biz_options = sorted(biz_map.keys())
+try:
+    biz_options, focus_patterns = load_map(MAP_FILE, map_mtime)
+except ValueError as e:
+    st.error(str(e))
+    st.stop()
 # ------------------------------------
 
+# ---------- INDUSTRY LOOKUPS ----------
+@st.cache_data(show_spinner=False)
+def derive_lookups(_df: pd.DataFrame, mtime: float) -> tuple[list[str], np.ndarray]:
+    """Tokenise industries once: sorted tag vocabulary + row × tag bool matrix."""
+    tokens = (_df["industry"].fillna("").reset_index(drop=True)
+                             .str.split(_TAG_SEP).explode().str.strip())
+    tokens = tokens[tokens != ""]
+    tags = sorted(tokens.unique())
+    incidence = np.zeros((len(_df), len(tags)), dtype=bool)
+    incidence[tokens.index.to_numpy(), np.searchsorted(tags, tokens.to_numpy())] = True
+    return tags, incidence
+
+industry_tags, incidence = derive_lookups(df, data_mtime)
+
+@st.cache_data(show_spinner=False)
+def focus_tag_hits(tags: list[str], patterns: dict[str, str]) -> dict[str, np.ndarray]:
+    """focus → bool vector over the tag vocabulary (True where the focus owns the tag)."""
+    tags_lc = pd.Series(tags, dtype="string[pyarrow]").str.lower()
+    return {bf: tags_lc.str.contains(p).to_numpy(dtype=bool) for bf, p in patterns.items()}
+
+focus_tags_by_focus = focus_tag_hits(industry_tags, focus_patterns)
+# ---------------------------------------
+
+# ---------- RESULT CARD STYLE ----------
+# consistent font & tabular numbers
+RESULT_CSS = """
+<style>
+.rec{
+  font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,
+              Helvetica,Arial,sans-serif;
+  font-size:16px;line-height:1.45em;
+  font-variant-numeric: tabular-nums; /* even-width digits */
+}
+.rec h3{font-size:24px;margin-bottom:4px;}
+</style>
+"""
+# ---------------------------------------
+
 # ---------- PAGE TITLE ----------
 st.set_page_config(page_title="Franchise Fit Finder")
 st.title("Franchise Fit Finder")
 st.write("Answer the questions below to get your personalized franchise short‑list.")
 # --------------------------------
 
-# ---------- OPTIONAL CONTACT INFO ----------
-st.text_input("Your Name (optional)")
-st.text_input("Your Email (optional)")
-st.text_input("Your Phone (optional)")
-# ------------------------------------------
-
-# ---------- BUSINESS‑FOCUS QUESTION ----------
-biz_focus = st.multiselect(
-    "Choose your preferred Focus *(pick up to 3)*",
-    biz_options,
-    max_selections=3,
-)
-# ------------------------------------------
-
-# ---------- OTHER QUESTIONS ----------
-liquid_capital = st.selectbox(
-    "Liquid capital available today?",
-    ["Please select", "Under $50k", "$50k-$99k", "$100k-$249k", "$250k+"],
-)
-
-finance = st.checkbox("Are you willing to finance beyond that cash?")
-
-hands_on_time = st.selectbox(
-    "Hands-on time once running?",
-    ["Please select", "Full-time owner-operator",
-     "5-20 hrs/week (semi-absentee)", "<5 hrs/week (passive)"],
-)
-
-industry_tags = sorted({t.strip() for cell in df["industry"].dropna()
-                        for t in str(cell).split(",")})
-industry_interests = st.multiselect(
-    "Which industries are you most interested in? (optional)",
-    industry_tags,
-)
-
-customer_type = st.selectbox(
-    "Who would you rather sell to?",
-    ["Please select", "Businesses (B2B)", "Consumers (B2C)", "Either or Both"],
-)
-# ------------------------------------------
+# ---------- QUESTION FORM ----------
+# widgets sit in a form: editing them doesn't rerun the script, only the
+# submit button does
+with st.form("franchise_q"):
+    # ---------- OPTIONAL CONTACT INFO ----------
+    st.text_input("Your Name (optional)")
+    st.text_input("Your Email (optional)")
+    st.text_input("Your Phone (optional)")
+    # ------------------------------------------
+
+    # ---------- BUSINESS‑FOCUS QUESTION ----------
+    biz_focus = st.multiselect(
+        "Choose your preferred Focus *(pick up to 3)*",
+        biz_options,
+        max_selections=3,
+    )
+    # ------------------------------------------
+
+    # ---------- OTHER QUESTIONS ----------
+    liquid_capital = st.selectbox(
+        "Liquid capital available today?",
+        ["Please select", *CAP_LIMITS],
+    )
+
+    finance = st.checkbox("Are you willing to finance beyond that cash?")
+
+    hands_on_time = st.selectbox(
+        "Hands-on time once running?",
+        ["Please select", "Full-time owner-operator",
+         "5-20 hrs/week (semi-absentee)", "<5 hrs/week (passive)"],
+    )
+
+    industry_interests = st.multiselect(
+        "Which industries are you most interested in? (optional)",
+        industry_tags,
+    )
+
+    customer_type = st.selectbox(
+        "Who would you rather sell to?",
+        ["Please select", "Businesses (B2B)", "Consumers (B2C)", "Either or Both"],
+    )
+    # ------------------------------------------
+
+    submitted = st.form_submit_button("Find My Matches 🚀")
 
 # ---------- ACTION BUTTON ----------
-if st.button("Find My Matches 🚀"):
+if submitted:
 
     if not biz_focus:
         st.warning("Please pick at least one Business / Business‑Focus.")
@@ -115,121 +326,80 @@ if st.button("Find My Matches 🚀"):
     # ==========================================================
     #  BUSINESS‑FOCUS FILTER  (OR logic + score)
     # ==========================================================
-    def count_focus_matches(industry_cell: str) -> int:
-        inds = [i.strip().lower() for i in str(industry_cell).split(",")]
-        score = 0
-        for bf in biz_focus:
-            mapped = [x.lower() for x in biz_map[bf]]
-            if any(m in ind for m in mapped for ind in inds):
-                score += 1
-        return score
-
-    df_f = df[df["industry"].apply(lambda x: count_focus_matches(x) > 0)].copy()
-    if df_f.empty:
+    # tag × focus bool matrix from the cached per-focus vectors; a boolean
+    # matmul then gives row × focus "has any tag of that focus" in one
+    # native call, summed into the score
+    focus_tags = np.column_stack([focus_tags_by_focus[bf] for bf in biz_focus])
+    score = (incidence @ focus_tags).sum(axis=1)
+
+    focus_hit = score > 0
+    if not focus_hit.any():
         st.error("No franchises matched any of the selected Business‑Focus categories.")
         st.stop()
-
-    df_f["match_score"] = df_f["industry"].apply(count_focus_matches)
     # ==========================================================
 
     # ---------- FINANCIAL & OTHER FILTERS ----------
-    cap_map = {"Under $50k": 50_000, "$50k-$99k": 99_000,
-               "$100k-$249k": 249_000, "$250k+": 1_000_000}
-    cap_limit = cap_map[liquid_capital] * (2 if finance else 1)
+    # every predicate is ANDed in place into one bool mask; df is sliced once, at the end
+    cap_limit = CAP_LIMITS[liquid_capital] * (2 if finance else 1)
 
-    df_f["cash required low"] = (
-        df_f["cash required"].str.extract(r"(\d[\d,]*)")
-                             .replace({",": ""}, regex=True)
-                             .astype(float)
-    )
-    df_f = df_f[df_f["cash required low"] <= cap_limit]
+    mask = focus_hit & (df["cash_required_low"].to_numpy() <= cap_limit)
 
     if hands_on_time == "5-20 hrs/week (semi-absentee)":
-        df_f = df_f[df_f["semi-absentee ownership"] == "Yes"]
+        mask &= df["semi-absentee ownership"].to_numpy()
     elif hands_on_time == "<5 hrs/week (passive)":
-        df_f = df_f[df_f["passive franchise"] == "Yes"]
+        mask &= df["passive franchise"].to_numpy()
 
     if industry_interests:
-        df_f = df_f[df_f["industry"].apply(
-            lambda x: any(tag in str(x) for tag in industry_interests))
-        ]
+        # tags are sorted, so searchsorted maps each pick to its column
+        mask &= incidence[:, np.searchsorted(industry_tags, industry_interests)].any(axis=1)
 
-    if customer_type == "Businesses (B2B)" and "b2b" in df_f.columns:
-        df_f = df_f[df_f["b2b"].astype(str).str.lower() == "yes"]
-    elif customer_type == "Consumers (B2C)" and "b2c" in df_f.columns:
-        df_f = df_f[df_f["b2c"].astype(str).str.lower() == "yes"]
+    if customer_type == "Businesses (B2B)" and "b2b" in df.columns:
+        mask &= df["b2b"].to_numpy()
+    elif customer_type == "Consumers (B2C)" and "b2c" in df.columns:
+        mask &= df["b2c"].to_numpy()
 
-    # ---------- FINAL SORT ----------
-    df_f = df_f.sort_values(["match_score", "industry_ranking"],
-                            ascending=[False, True])
-
-    if df_f.empty:
+    if not mask.any():
         st.error("No franchises to display — please broaden your answers.")
         st.stop()
 
-    top_n = df_f.head(RESULT_LIMIT)
+    df_f = df.loc[mask, display_cols].assign(match_score=score[mask])
+
+    # ---------- FINAL SORT ----------
+    # order: score desc, then ranking asc (unranked last), then sheet order.
+    # One float key folds score and ranking together; argpartition picks the
+    # best RESULT_LIMIT in O(N) and only those (plus rows tied at the cut)
+    # get a stable sort
+    score_f = df_f["match_score"].to_numpy(dtype=np.float64)
+    rank_f  = df_f["industry_ranking"].to_numpy(dtype=np.float64)
+    rank_f  = np.where(np.isnan(rank_f), np.nanmax(rank_f, initial=0) + 1, rank_f)
+    key = -score_f * (rank_f.max() - rank_f.min() + 1) + rank_f
+
+    if len(key) > RESULT_LIMIT:
+        cut = key[np.argpartition(key, RESULT_LIMIT - 1)[RESULT_LIMIT - 1]]
+        cand = np.flatnonzero(key <= cut)           # in sheet order
+    else:
+        cand = np.arange(len(key))
+    top_n = df_f.iloc[cand[np.argsort(key[cand], kind="stable")][:RESULT_LIMIT]]
 
     # ---------- PRESENTATION ----------
-    st.subheader(f"✨ Your Top {len(top_n)} Franchise Recommendations ✨")
-
-    # --- Consistent font & tabular numbers ---
-    st.markdown("""
-    <style>
-    .rec{
-      font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,
-                  Helvetica,Arial,sans-serif;
-      font-size:16px;line-height:1.45em;
-      font-variant-numeric: tabular-nums; /* even-width digits */
-    }
-    .rec h3{font-size:24px;margin-bottom:4px;}
-    </style>
-    """, unsafe_allow_html=True)
-    # -----------------------------------------
-
-    # ---- New money() helper ----
-    def _format_single(num_str: str) -> str:
-        """'50000' -> '$50,000' ; returns fallback for zero/blank."""
-        n_str = re.sub(r"[^\d.]", "", num_str)
-        if n_str == "":
-            return "contact us for details"
-        n = float(n_str)
-        if not math.isfinite(n) or n == 0:
-            return "contact us for details"
-        return f"${n:,.0f}"
-
-    def money(val) -> str:
-        """Format single numbers or ranges; fallback otherwise."""
-        if val is None or pd.isna(val):
-            return "contact us for details"
-        txt = str(val).strip()
-        # Detect range separated by -, –, or —
-        if re.search(r"[-–—]", txt):
-            left, right = re.split(r"\s*[-–—]\s*", txt, maxsplit=1)
-            l_fmt, r_fmt = _format_single(left), _format_single(right)
-            if "contact us" in (l_fmt + r_fmt):
-                return "contact us for details"
-            return f"{l_fmt} — {r_fmt}"  # en dash between formatted parts
-        else:
-            return _format_single(txt)
-    # ---------------------------------
-
-    for _, row in top_n.iterrows():
-        val = lambda c: row[c] if c in row and pd.notna(row[c]) else "contact us for details"
-        brand = row["franchise name"]
-        link  = f"[{brand}]({val('url')})" if val('url') != "contact us for details" else brand
-
-        startup_cost  = money(row["cash required"])
-        franchise_fee = money(val(fee_col)) if fee_col else "contact us for details"
-        veteran_disc  = val("veteran discount")
-
-        st.markdown('<div class="rec">', unsafe_allow_html=True)
-        st.markdown(f"### {link}", unsafe_allow_html=True)
-        st.markdown(f"**Industry:** {val('industry')}")
-        st.markdown(f"**Description:** {val('business summary')}")
-        st.markdown(f"**Startup Cost:** {startup_cost}")
-        st.markdown(f"**Franchise Fee:** {franchise_fee}")
-        st.markdown(f"**Veteran Discount:** {veteran_disc}")
-        st.markdown(f"**Industry Ranking:** {val('industry_ranking')}")
-        st.markdown(f"**Number of Units Open:** {val('number of units open')}")
-        st.markdown(f"**Support:** {val('support')}")
-        st.markdown("</div><hr>", unsafe_allow_html=True)
+    # stylesheet, heading and every card go out in a single st.markdown call
+    parts = [RESULT_CSS.strip(),
+             f"<h3>✨ Your Top {len(top_n)} Franchise Recommendations ✨</h3>"]
+    # card columns come preformatted from the loader; zipped in DISPLAY_COLS order
+    for (link, industry, summary, startup_cost, franchise_fee,
+         veteran, rank, units, support) in zip(
+            *(top_n[c].to_numpy(dtype=object) for c in DISPLAY_COLS)):
+        parts.append(
+            '<div class="rec">'
+            f"<h3>{link}</h3>"
+            f"<p><b>Industry:</b> {industry}</p>"
+            f"<p><b>Description:</b> {summary}</p>"
+            f"<p><b>Startup Cost:</b> {startup_cost}</p>"
+            f"<p><b>Franchise Fee:</b> {franchise_fee}</p>"
+            f"<p><b>Veteran Discount:</b> {veteran}</p>"
+            f"<p><b>Industry Ranking:</b> {rank}</p>"
+            f"<p><b>Number of Units Open:</b> {units}</p>"
+            f"<p><b>Support:</b> {support}</p>"
+            "</div><hr>"
+        )
+    st.markdown("\n".join(parts), unsafe_allow_html=True)